@@ -1,28 +1,45 @@
 import pytest
 import os
 import json
-
-
-@pytest.fixture
+import functools
+
+# Prefer a C-backed JSON parser for fixture decoding when one is available.
+# Neither is a hard test dependency; stdlib json remains the fallback.
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = None
+
+
+@functools.lru_cache(maxsize=None)
+def load_json_fixture(filename):
+    """Load (and memoize) a JSON document from the fixtures directory."""
+    with open(os.path.join(os.path.dirname(__file__), 'fixtures', filename), 'rb') as fp:
+        data = fp.read()
+    if _fast_json is not None:
+        return _fast_json.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+@pytest.fixture(scope='session')
 def root_provider_fixtures():
     # fixtures for testing validate_v1_path for root provider
-    with open(os.path.join(os.path.dirname(__file__), 'fixtures/root_provider.json'), 'r') as fp:
-        return json.load(fp)
+    return load_json_fixture('root_provider.json')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def revision_fixtures():
-    with open(os.path.join(os.path.dirname(__file__), 'fixtures/revisions.json'), 'r') as fp:
-        return json.load(fp)
+    return load_json_fixture('revisions.json')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sharing_fixtures():
-    with open(os.path.join(os.path.dirname(__file__), 'fixtures/sharing.json'), 'r') as fp:
-        return json.load(fp)
+    return load_json_fixture('sharing.json')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def error_fixtures():
-    with open(os.path.join(os.path.dirname(__file__), 'fixtures/errors.json'), 'r') as fp:
-        return json.load(fp)
+    return load_json_fixture('errors.json')
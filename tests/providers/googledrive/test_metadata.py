@@ -1,9 +1,6 @@
 import pytest
 
-import os
-
 from waterbutler.providers.googledrive.provider import GoogleDrivePath
-from waterbutler.providers.googledrive.provider import GoogleDrivePathPart
 from waterbutler.providers.googledrive.metadata import GoogleDriveRevision
 from waterbutler.providers.googledrive.metadata import GoogleDriveFileMetadata
 from waterbutler.providers.googledrive.metadata import GoogleDriveFolderMetadata
@@ -16,11 +13,19 @@ from tests.providers.googledrive.fixtures import(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basepath():
     return GoogleDrivePath('/conrad')
 
 
+def _expected_path(path, folder=False):
+    """Build the raw path string a metadata object should report."""
+    expected = '/'.join(x.raw for x in path.parts)
+    if folder:
+        expected += '/'
+    return expected
+
+
 class TestMetadata:
 
     def test_file_metadata_drive(self, basepath, root_provider_fixtures):
@@ -42,7 +47,7 @@ class TestMetadata:
             'webView': item['alternateLink'],
             'hashes': {'md5': item['md5Checksum']},
         }
-        assert parsed.path == '/' + os.path.join(*[x.raw for x in path.parts])
+        assert parsed.path == _expected_path(path)
         assert parsed.materialized_path == str(path)
         assert parsed.is_google_doc is False
         assert parsed.export_name == item['title']
@@ -66,7 +71,7 @@ class TestMetadata:
             'webView': item['alternateLink'],
             'hashes': {'md5': item['md5Checksum']},
         }
-        assert parsed.path == '/' + os.path.join(*[x.raw for x in path.parts])
+        assert parsed.path == _expected_path(path)
         assert parsed.materialized_path == str(path)
         assert parsed.is_google_doc is False
         assert parsed.export_name == item['title']
@@ -94,7 +99,7 @@ class TestMetadata:
         assert parsed.id == item['id']
         assert parsed.name == item['title']
         assert parsed.extra == {'revisionId': item['version']}
-        assert parsed.path == '/' + os.path.join(*[x.raw for x in path.parts]) + '/'
+        assert parsed.path == _expected_path(path, folder=True)
         assert parsed.materialized_path == str(path)
         assert parsed.export_name == item['title']
 
@@ -107,7 +112,7 @@ class TestMetadata:
         assert parsed.id == item['id']
         assert parsed.name == item['title']
         assert parsed.extra == {'revisionId': item['version']}
-        assert parsed.path == '/' + os.path.join(*[x.raw for x in path.parts]) + '/'
+        assert parsed.path == _expected_path(path, folder=True)
         assert parsed.materialized_path == str(path)
         assert parsed.export_name == item['title']
 
@@ -3,6 +3,7 @@ import os
 import copy
 import json
 from http import client
+from types import MappingProxyType
 from urllib import parse
 
 import pytest
@@ -42,32 +43,32 @@ def file_stream(file_like):
     return streams.FileStreamReader(file_like)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth():
-    return {
+    return MappingProxyType({
         'name': 'cat',
         'email': 'cat@cat.com',
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def credentials():
-    return {'token': 'hugoandkim'}
+    return MappingProxyType({'token': 'hugoandkim'})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def other_credentials():
-    return {'token': 'hugoandprobablynotkim'}
+    return MappingProxyType({'token': 'hugoandprobablynotkim'})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def settings():
-    return {
+    return MappingProxyType({
         'folder': {
             'id': '19003e',
             'name': '/conrad/birdie',
         },
-    }
+    })
 
 
 @pytest.fixture
@@ -80,54 +81,53 @@ def other_provider(auth, other_credentials, settings):
     return GoogleDriveProvider(auth, other_credentials, settings)
 
 
-@pytest.fixture
-def search_for_file_response():
-    return {
-        'items': [
-            {'id': '1234ideclarethumbwar'}
-        ]
-    }
+_SEARCH_FOR_FILE_RESPONSE = {
+    'items': [
+        {
+            'id': '1234ideclarethumbwar',
+            'mimeType': 'text/plain',
+            'title': 'B.txt',
+        }
+    ]
+}
+
+_NO_FILE_RESPONSE = {
+    'items': []
+}
+
+_SEARCH_FOR_FOLDER_RESPONSE = {
+    'items': [
+        {
+            'id': 'whyis6afraidof7',
+            'mimeType': 'application/vnd.google-apps.folder',
+            'title': 'A',
+        }
+    ]
+}
+
+_NO_FOLDER_RESPONSE = {
+    'items': []
+}
 
 
 @pytest.fixture
-def no_file_response():
-    return {
-        'items': []
-    }
+def search_for_file_response():
+    return _SEARCH_FOR_FILE_RESPONSE
 
 
 @pytest.fixture
-def actual_file_response():
-    return {
-        'id': '1234ideclarethumbwar',
-        'mimeType': 'text/plain',
-        'title': 'B.txt',
-    }
+def no_file_response():
+    return _NO_FILE_RESPONSE
 
 
 @pytest.fixture
 def search_for_folder_response():
-    return {
-        'items': [
-            {'id': 'whyis6afraidof7'}
-        ]
-    }
+    return _SEARCH_FOR_FOLDER_RESPONSE
 
 
 @pytest.fixture
 def no_folder_response():
-    return {
-        'items': []
-    }
-
-
-@pytest.fixture
-def actual_folder_response():
-    return {
-        'id': 'whyis6afraidof7',
-        'mimeType': 'application/vnd.google-apps.folder',
-        'title': 'A',
-    }
+    return _NO_FOLDER_RESPONSE
 
 
 def make_unauthorized_file_access_error(file_id):
@@ -175,7 +175,7 @@ def clean_query(query: str):
     return query.replace('\\', r'\\').replace("'", r"\'")
 
 
-def _build_title_search_query(provider, entity_name, is_folder=True):
+def _build_title_search_query(provider, entity_name, parent_id, is_folder=True):
     return "title = '{}' " \
         "and trashed = false " \
         "and mimeType != 'application/vnd.google-apps.form' " \
@@ -184,13 +184,50 @@ def _build_title_search_query(provider, entity_name, is_folder=True):
         "and mimeType != 'application/vnd.google-apps.drawing' " \
         "and mimeType != 'application/vnd.google-apps.presentation' " \
         "and mimeType != 'application/vnd.google-apps.spreadsheet' " \
-        "and mimeType {} '{}'".format(
+        "and mimeType {} '{}' " \
+        "and '{}' in parents".format(
             entity_name,
             '=' if is_folder else '!=',
-            provider.FOLDER_MIME_TYPE
+            provider.FOLDER_MIME_TYPE,
+            parent_id
         )
 
 
+def register_json_uris(routes):
+    """Register a batch of aiohttpretty JSON routes.
+
+    ``routes`` maps a key to a ``(method, url, body)`` tuple; the same keys
+    are returned mapped to their URLs so tests can assert on them.
+    """
+    urls = {}
+    for key, (method, url, body) in routes.items():
+        aiohttpretty.register_json_uri(method, url, body=body)
+        urls[key] = url
+    return urls
+
+
+def _register_validate_uris(provider, entity_name, is_folder,
+                            search_response, wrong_kind_response):
+    """Register the search/wrong-kind-search URI pair that a
+    ``validate_v1_path`` call exercises, returning the URLs for assertions.
+    """
+    query_url = provider.build_url(
+        'files',
+        q=_build_title_search_query(provider, entity_name, provider.folder['id'], is_folder),
+        fields='items(id,title,mimeType)'
+    )
+    wrong_query_url = provider.build_url(
+        'files',
+        q=_build_title_search_query(provider, entity_name, provider.folder['id'], not is_folder),
+        fields='items(id,title,mimeType)'
+    )
+
+    return register_json_uris({
+        'query': ('GET', query_url, search_response),
+        'wrong_query': ('GET', wrong_query_url, wrong_kind_response),
+    })
+
+
 def generate_list(child_id, root_provider_fixtures, **kwargs):
     item = {}
     item.update(root_provider_fixtures['list_file']['items'][0])
@@ -204,25 +241,11 @@ class TestValidatePath:
     @pytest.mark.asyncio
     @pytest.mark.aiohttpretty
     async def test_validate_v1_path_file(self, provider, search_for_file_response,
-                                         actual_file_response, no_folder_response):
+                                         no_folder_response):
         file_name = 'file.txt'
-        file_id = '1234ideclarethumbwar'
 
-        query_url = provider.build_url(
-            'files', provider.folder['id'], 'children',
-            q=_build_title_search_query(provider, file_name, False),
-            fields='items(id)'
-        )
-        wrong_query_url = provider.build_url(
-            'files', provider.folder['id'], 'children',
-            q=_build_title_search_query(provider, file_name, True),
-            fields='items(id)'
-        )
-        specific_url = provider.build_url('files', file_id, fields='id,title,mimeType')
-
-        aiohttpretty.register_json_uri('GET', query_url, body=search_for_file_response)
-        aiohttpretty.register_json_uri('GET', wrong_query_url, body=no_folder_response)
-        aiohttpretty.register_json_uri('GET', specific_url, body=actual_file_response)
+        _register_validate_uris(provider, file_name, False,
+                                search_for_file_response, no_folder_response)
 
         try:
             wb_path_v1 = await provider.validate_v1_path('/' + file_name)
@@ -241,25 +264,11 @@ class TestValidatePath:
     @pytest.mark.asyncio
     @pytest.mark.aiohttpretty
     async def test_validate_v1_path_folder(self, provider, search_for_folder_response,
-                                           actual_folder_response, no_file_response):
+                                           no_file_response):
         folder_name = 'foofolder'
-        folder_id = 'whyis6afraidof7'
 
-        query_url = provider.build_url(
-            'files', provider.folder['id'], 'children',
-            q=_build_title_search_query(provider, folder_name, True),
-            fields='items(id)'
-        )
-        wrong_query_url = provider.build_url(
-            'files', provider.folder['id'], 'children',
-            q=_build_title_search_query(provider, folder_name, False),
-            fields='items(id)'
-        )
-        specific_url = provider.build_url('files', folder_id, fields='id,title,mimeType')
-
-        aiohttpretty.register_json_uri('GET', query_url, body=search_for_folder_response)
-        aiohttpretty.register_json_uri('GET', wrong_query_url, body=no_file_response)
-        aiohttpretty.register_json_uri('GET', specific_url, body=actual_folder_response)
+        _register_validate_uris(provider, folder_name, True,
+                                search_for_folder_response, no_file_response)
 
         try:
             wb_path_v1 = await provider.validate_v1_path('/' + folder_name + '/')
@@ -299,15 +308,11 @@ class TestValidatePath:
         current_part = parts.pop(0)
         part_name, part_is_folder = current_part[0], current_part[1]
         name, ext = os.path.splitext(part_name)
-        query = _build_title_search_query(provider, file_name.strip('/'), False)
+        query = _build_title_search_query(provider, file_name.strip('/'), file_id, False)
 
-        url = provider.build_url('files', file_id, 'children', q=query, fields='items(id)')
+        url = provider.build_url('files', q=query, fields='items(id,title,mimeType)')
         aiohttpretty.register_json_uri('GET', url, body=revalidate_path_metadata)
 
-        url = provider.build_url('files', file_id, fields='id,title,mimeType')
-        aiohttpretty.register_json_uri('GET', url,
-                                       body=root_provider_fixtures['revalidate_path_file_metadata_2'])
-
         result = await provider.revalidate_path(path, file_name)
 
         assert result.name in path.name
@@ -328,15 +333,13 @@ class TestValidatePath:
         gd_ext = drive_utils.get_mimetype_from_ext(ext)
         query = "title = '{}' " \
                 "and trashed = false " \
-                "and mimeType = '{}'".format(clean_query(name), gd_ext)
-
-        url = provider.build_url('files', file_id, 'children', q=query, fields='items(id)')
-        aiohttpretty.register_json_uri('GET', url,
-                                       body=root_provider_fixtures['revalidate_path_file_metadata_1'])
+                "and mimeType = '{}' " \
+                "and '{}' in parents".format(clean_query(name), gd_ext, file_id)
 
-        url = provider.build_url('files', file_id, fields='id,title,mimeType')
-        aiohttpretty.register_json_uri('GET', url,
-                                       body=root_provider_fixtures['revalidate_path_gdoc_file_metadata'])
+        url = provider.build_url('files', q=query, fields='items(id,title,mimeType)')
+        aiohttpretty.register_json_uri('GET', url, body={
+            'items': [root_provider_fixtures['revalidate_path_gdoc_file_metadata']]
+        })
 
         result = await provider.revalidate_path(path, file_name)
 
@@ -355,16 +358,12 @@ class TestValidatePath:
         current_part = parts.pop(0)
         part_name, part_is_folder = current_part[0], current_part[1]
         name, ext = os.path.splitext(part_name)
-        query = _build_title_search_query(provider, file_name.strip('/') + '/', True)
+        query = _build_title_search_query(provider, file_name.strip('/') + '/', file_id, True)
 
-        folder_one_url = provider.build_url('files', file_id, 'children', q=query, fields='items(id)')
-        aiohttpretty.register_json_uri('GET', folder_one_url,
+        folder_url = provider.build_url('files', q=query, fields='items(id,title,mimeType)')
+        aiohttpretty.register_json_uri('GET', folder_url,
                                        body=root_provider_fixtures['revalidate_path_folder_metadata_1'])
 
-        folder_two_url = provider.build_url('files', file_id, fields='id,title,mimeType')
-        aiohttpretty.register_json_uri('GET', folder_two_url,
-                                       body=root_provider_fixtures['revalidate_path_folder_metadata_2'])
-
         result = await provider.revalidate_path(path, file_name, True)
         assert result.name in path.name
 
@@ -379,8 +378,7 @@ class TestUpload:
         path = WaterButlerPath('/birdie.jpg', _ids=(provider.folder['id'], None))
 
         start_upload_url = provider._build_upload_url('files', uploadType='resumable')
-        finish_upload_url = provider._build_upload_url('files', uploadType='resumable',
-                                                       upload_id=upload_id)
+        finish_upload_url = 'http://waterbutler.io?upload_id={}'.format(upload_id)
 
         aiohttpretty.register_json_uri('PUT', finish_upload_url, body=item)
         aiohttpretty.register_uri('POST', start_upload_url,
@@ -403,8 +401,7 @@ class TestUpload:
         path = GoogleDrivePath('/birdie%2F %20".jpg', _ids=(provider.folder['id'], None))
 
         start_upload_url = provider._build_upload_url('files', uploadType='resumable')
-        finish_upload_url = provider._build_upload_url('files', uploadType='resumable',
-                                                       upload_id=upload_id)
+        finish_upload_url = 'http://waterbutler.io?upload_id={}'.format(upload_id)
 
         aiohttpretty.register_json_uri('PUT', finish_upload_url, body=item)
         aiohttpretty.register_uri('POST', start_upload_url,
@@ -428,8 +425,7 @@ class TestUpload:
 
         start_upload_url = provider._build_upload_url('files', path.identifier,
                                                       uploadType='resumable')
-        finish_upload_url = provider._build_upload_url('files', path.identifier,
-                                                       uploadType='resumable', upload_id=upload_id)
+        finish_upload_url = 'http://waterbutler.io?upload_id={}'.format(upload_id)
 
         aiohttpretty.register_json_uri('PUT', finish_upload_url, body=item)
         aiohttpretty.register_uri('PUT', start_upload_url,
@@ -453,8 +449,7 @@ class TestUpload:
         )
 
         start_upload_url = provider._build_upload_url('files', uploadType='resumable')
-        finish_upload_url = provider._build_upload_url('files', uploadType='resumable',
-                                                       upload_id=upload_id)
+        finish_upload_url = 'http://waterbutler.io?upload_id={}'.format(upload_id)
         aiohttpretty.register_uri('POST', start_upload_url,
                                   headers={'LOCATION': 'http://waterbutler.io?upload_id={}'.format(upload_id)})
         aiohttpretty.register_json_uri('PUT', finish_upload_url, body=item)
@@ -473,8 +468,7 @@ class TestUpload:
         path = WaterButlerPath('/birdie.jpg', _ids=(provider.folder['id'], None))
 
         start_upload_url = provider._build_upload_url('files', uploadType='resumable')
-        finish_upload_url = provider._build_upload_url('files', uploadType='resumable',
-                                                       upload_id=upload_id)
+        finish_upload_url = 'http://waterbutler.io?upload_id={}'.format(upload_id)
 
         aiohttpretty.register_json_uri('PUT', finish_upload_url,
                                        body=root_provider_fixtures['checksum_mismatch_metadata'])
@@ -1448,15 +1442,31 @@ class TestCreateFolder:
 
     @pytest.mark.asyncio
     @pytest.mark.aiohttpretty
-    async def test_already_exists(self, provider):
-        path = WaterButlerPath('/hugo/', _ids=('doesnt', 'matter'))
+    @pytest.mark.parametrize('path_str,ids,mock_status,exc,code,message', [
+        ('/hugo/', ('doesnt', 'matter'), None, exceptions.FolderNamingConflict, 409,
+         ('Cannot create folder "hugo", because a file or folder '
+          'already exists with that name')),
+        ('/hugo/kim/pins/', (None, 'something', 'something', None), 418,
+         exceptions.CreateFolderError, 418, None),
+        ('/carp.fish', ('doesnt', 'matter'), None, exceptions.CreateFolderError, 400,
+         'Path must be a directory'),
+    ])
+    async def test_create_folder_errors(self, provider, path_str, ids, mock_status, exc, code,
+                                        message):
+        if ids[0] is None:
+            ids = (provider.folder['id'], ) + ids[1:]
+        path = WaterButlerPath(path_str, _ids=ids)
+
+        if mock_status is not None:
+            aiohttpretty.register_json_uri('POST', provider.build_url('files'),
+                                           status=mock_status)
 
-        with pytest.raises(exceptions.FolderNamingConflict) as e:
+        with pytest.raises(exc) as e:
             await provider.create_folder(path)
 
-        assert e.value.code == 409
-        assert e.value.message == ('Cannot create folder "hugo", because a file or folder '
-                                   'already exists with that name')
+        assert e.value.code == code
+        if message is not None:
+            assert e.value.message == message
 
     @pytest.mark.asyncio
     @pytest.mark.aiohttpretty
@@ -1472,51 +1482,36 @@ class TestCreateFolder:
         assert resp.name == 'osf test'
         assert resp.path == '/osf%20test/'
 
-    @pytest.mark.asyncio
-    @pytest.mark.aiohttpretty
-    async def test_raises_non_404(self, provider):
-        path = WaterButlerPath('/hugo/kim/pins/', _ids=(provider.folder['id'],
-                                                        'something', 'something', None))
-
-        url = provider.build_url('files')
-        aiohttpretty.register_json_uri('POST', url, status=418)
-
-        with pytest.raises(exceptions.CreateFolderError) as e:
-            await provider.create_folder(path)
-
-        assert e.value.code == 418
-
-    @pytest.mark.asyncio
-    @pytest.mark.aiohttpretty
-    async def test_must_be_folder(self, provider, monkeypatch):
-        with pytest.raises(exceptions.CreateFolderError):
-            await provider.create_folder(WaterButlerPath('/carp.fish', _ids=('doesnt', 'matter')))
-
 
 class TestIntraFunctions:
 
     @pytest.mark.asyncio
     @pytest.mark.aiohttpretty
-    async def test_intra_move_file(self, provider, root_provider_fixtures):
+    @pytest.mark.parametrize('op,http_method,url_segments', [
+        ('intra_move', 'PATCH', ()),
+        ('intra_copy', 'POST', ('copy', )),
+    ])
+    async def test_intra_move_copy_file(self, provider, root_provider_fixtures, op, http_method,
+                                        url_segments):
         item = root_provider_fixtures['docs_file_metadata']
         src_path = WaterButlerPath('/unsure.txt', _ids=(provider.folder['id'], item['id']))
         dest_path = WaterButlerPath('/really/unsure.txt', _ids=(provider.folder['id'],
                                                                 item['id'], item['id']))
 
-        url = provider.build_url('files', src_path.identifier)
+        url = provider.build_url('files', src_path.identifier, *url_segments)
         data = json.dumps({
             'parents': [{
                 'id': dest_path.parent.identifier
             }],
             'title': dest_path.name
         }),
-        aiohttpretty.register_json_uri('PATCH', url, data=data, body=item)
+        aiohttpretty.register_json_uri(http_method, url, data=data, body=item)
 
         delete_url = provider.build_url('files', item['id'])
         del_url_body = json.dumps({'labels': {'trashed': 'true'}})
         aiohttpretty.register_uri('PUT', delete_url, body=del_url_body, status=200)
 
-        result, created = await provider.intra_move(provider, src_path, dest_path)
+        result, created = await getattr(provider, op)(provider, src_path, dest_path)
         expected = GoogleDriveFileMetadata(item, dest_path)
 
         assert result == expected
@@ -1559,33 +1554,6 @@ class TestIntraFunctions:
         assert result == expected
         assert aiohttpretty.has_call(method='PUT', uri=delete_url)
 
-    @pytest.mark.asyncio
-    @pytest.mark.aiohttpretty
-    async def test_intra_copy_file(self, provider, root_provider_fixtures):
-        item = root_provider_fixtures['docs_file_metadata']
-        src_path = WaterButlerPath('/unsure.txt', _ids=(provider.folder['id'], item['id']))
-        dest_path = WaterButlerPath('/really/unsure.txt', _ids=(provider.folder['id'],
-                                                                item['id'], item['id']))
-
-        url = provider.build_url('files', src_path.identifier, 'copy')
-        data = json.dumps({
-            'parents': [{
-                'id': dest_path.parent.identifier
-            }],
-            'title': dest_path.name
-        }),
-        aiohttpretty.register_json_uri('POST', url, data=data, body=item)
-
-        delete_url = provider.build_url('files', item['id'])
-        del_url_body = json.dumps({'labels': {'trashed': 'true'}})
-        aiohttpretty.register_uri('PUT', delete_url, body=del_url_body, status=200)
-
-        result, created = await provider.intra_copy(provider, src_path, dest_path)
-        expected = GoogleDriveFileMetadata(item, dest_path)
-
-        assert result == expected
-        assert aiohttpretty.has_call(method='PUT', uri=delete_url)
-
 
 class TestOperationsOrMisc:
 
@@ -1644,10 +1612,9 @@ class TestOperationsOrMisc:
         parts[-1][1] = False
         current_part = parts.pop(0)
         part_name, part_is_folder = current_part[0], current_part[1]
-        query = _build_title_search_query(provider, part_name, True)
+        query = _build_title_search_query(provider, part_name, provider.folder['id'], True)
 
-        url = provider.build_url('files', provider.folder['id'], 'children',
-                                 q=query, fields='items(id)')
+        url = provider.build_url('files', q=query, fields='items(id,title,mimeType)')
         aiohttpretty.register_json_uri('GET', url,
                                        body=error_fixtures['parts_file_missing_metadata'])
 
@@ -179,7 +179,8 @@ class BaseProvider(metaclass=abc.ABCMeta):
         return {}
 
     def build_headers(self, **kwargs) -> dict:
-        headers = self.default_headers
+        # Copy so that providers may hand out a shared default-headers dict.
+        headers = dict(self.default_headers)
         headers.update(kwargs)
         return {
             key: value
@@ -210,6 +211,12 @@ class BaseProvider(metaclass=abc.ABCMeta):
         loop = asyncio.get_event_loop()
         session = self.loop_session_map.get(loop, None)
         if not session:
+            if connector is None:
+                connector = aiohttp.TCPConnector(
+                    limit=wb_settings.AIOHTTP_CONNECTOR_LIMIT,
+                    limit_per_host=wb_settings.AIOHTTP_CONNECTOR_LIMIT_PER_HOST,
+                    keepalive_timeout=wb_settings.AIOHTTP_KEEPALIVE_TIMEOUT,
+                )
             session = aiohttp.ClientSession(connector=connector)
             self.loop_session_map[loop] = session
             self.session_list.append(session)
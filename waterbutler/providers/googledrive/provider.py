@@ -1,12 +1,13 @@
 import os
 import json
+import asyncio
 import hashlib
 import functools
 from urllib import parse
 from http import HTTPStatus
 from typing import List, Sequence, Tuple, Union
 
-import furl
+import ujson
 
 from waterbutler.core import exceptions, provider, streams
 from waterbutler.core.path import WaterButlerPath, WaterButlerPathPart
@@ -20,10 +21,39 @@ from waterbutler.providers.googledrive.metadata import (GoogleDriveRevision,
                                                         GoogleDriveFileRevisionMetadata, )
 
 
+# Escapes \ as \\ and ' as \' -- note only single quotes need to be escaped
+_QUERY_ESCAPE_TABLE = str.maketrans({'\\': r'\\', "'": r"\'"})
+
+
 def clean_query(query: str):
-    # Replace \ with \\ and ' with \'
-    # Note only single quotes need to be escaped
-    return query.replace('\\', r'\\').replace("'", r"\'")
+    return query.translate(_QUERY_ESCAPE_TABLE)
+
+
+# Search clauses excluding the google-apps mime types WaterButler cannot surface as files or
+# folders, joined once at import time instead of on every path resolution.
+EXCLUDED_MIME_CLAUSES = ' and '.join(
+    "mimeType != '{}'".format(mime) for mime in (
+        'application/vnd.google-apps.form',
+        'application/vnd.google-apps.map',
+        'application/vnd.google-apps.document',
+        'application/vnd.google-apps.drawing',
+        'application/vnd.google-apps.presentation',
+        'application/vnd.google-apps.spreadsheet',
+    )
+)
+
+# The per-segment search query used by `_resolve_path_to_ids()` for non-gdoc segments, fully
+# assembled at import time; only the per-segment values are filled in per call.
+SEGMENT_QUERY_TEMPLATE = (
+    "title = '{name}' "
+    "and trashed = false "
+    "and " + EXCLUDED_MIME_CLAUSES + " "
+    "and mimeType {op} 'application/vnd.google-apps.folder' "
+    "and '{parent}' in parents"
+)
+
+# Request body that moves a file to the trash, serialized once at import time.
+TRASH_BODY = json.dumps({'labels': {'trashed': 'true'}})
 
 
 class GoogleDrivePathPart(WaterButlerPathPart):
@@ -82,6 +112,16 @@ class GoogleDriveProvider(provider.BaseProvider):
         super().__init__(auth, credentials, settings, **kwargs)
         self.token = self.credentials['token']
         self.folder = self.settings['folder']
+        self._default_headers = {'authorization': 'Bearer {}'.format(self.token)}
+        # Memoizes successfully resolved path segments for the life of this provider instance.
+        # Keyed by (parent_id, segment_name, is_folder); see `_resolve_path_to_ids()`.
+        self._segment_cache = {}  # type: dict
+        # Caches folder-listing pages as (etag, items, next_link) keyed by page URL so repeat
+        # listings can send If-None-Match and skip the body on 304; see `_folder_metadata()`.
+        self._folder_list_cache = {}  # type: dict
+        # Caches the current-version file metadata by file id so `revisions()` can fall back to
+        # it without re-fetching; see `_file_metadata()`.
+        self._file_metadata_cache = {}  # type: dict
 
     async def validate_v1_path(self, path: str, **kwargs) -> GoogleDrivePath:
         if path == '/':
@@ -131,7 +171,8 @@ class GoogleDriveProvider(provider.BaseProvider):
 
     @property
     def default_headers(self) -> dict:
-        return {'authorization': 'Bearer {}'.format(self.token)}
+        # Built once in ``__init__``; ``build_headers`` copies before updating.
+        return self._default_headers
 
     def can_intra_move(self, other: provider.BaseProvider, path: WaterButlerPath=None) -> bool:
         return self == other
@@ -163,7 +204,9 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, ),
             throws=exceptions.IntraMoveError,
         )
-        data = await resp.json()
+        data = await resp.json(loads=ujson.loads)
+        self._segment_cache.clear()
+        self._file_metadata_cache.clear()
 
         created = dest_path.identifier is None
         dest_path.parts[-1]._id = data['id']
@@ -196,7 +239,7 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, ),
             throws=exceptions.IntraMoveError,
         )
-        data = await resp.json()
+        data = await resp.json(loads=ujson.loads)
 
         # GoogleDrive doesn't support intra-copy for folders, so dest_path will always
         # be a file.  See can_intra_copy() for type check.
@@ -262,15 +305,16 @@ class GoogleDriveProvider(provider.BaseProvider):
         stream.add_writer('md5', streams.HashStreamWriter(hashlib.md5))
 
         upload_metadata = self._build_upload_metadata(path.parent.identifier, path.name)
-        upload_id = await self._start_resumable_upload(not path.identifier, segments, stream.size,
-                                                       upload_metadata)
-        data = await self._finish_resumable_upload(segments, stream, upload_id)
+        location = await self._start_resumable_upload(not path.identifier, segments, stream.size,
+                                                      upload_metadata)
+        data = await self._finish_resumable_upload(stream, location)
 
         if data['md5Checksum'] != stream.writers['md5'].hexdigest:
             raise exceptions.UploadChecksumMismatchError()
 
         created = path.identifier is None
         path._parts[-1]._id = data.get('id')
+        self._file_metadata_cache.pop(path.identifier, None)
         return GoogleDriveFileMetadata(data, path), created
 
     async def delete(self,  # type: ignore
@@ -297,6 +341,8 @@ class GoogleDriveProvider(provider.BaseProvider):
             self.metrics.add('delete.root_delete_confirmed', confirm_delete == 1)
             if confirm_delete == 1:
                 await self._delete_folder_contents(path)
+                self._segment_cache.clear()
+                self._file_metadata_cache.clear()
                 return
             else:
                 raise exceptions.DeleteError(
@@ -307,20 +353,24 @@ class GoogleDriveProvider(provider.BaseProvider):
         await self.make_request(
             'PUT',
             self.build_url('files', path.identifier),
-            data=json.dumps({'labels': {'trashed': 'true'}}),
+            data=TRASH_BODY,
             headers={'Content-Type': 'application/json'},
             expects=(200, ),
             throws=exceptions.DeleteError,
         )
+        self._segment_cache.clear()
+        self._file_metadata_cache.pop(path.identifier, None)
         return
 
+    # The constant clauses of `_build_query()`, assembled once rather than per call.
+    BASE_QUERY_CLAUSES = [
+        'trashed = false',
+        "mimeType != 'application/vnd.google-apps.form'",
+        "mimeType != 'application/vnd.google-apps.map'",
+    ]
+
     def _build_query(self, folder_id: str, title: str=None) -> str:
-        queries = [
-            "'{}' in parents".format(folder_id),
-            'trashed = false',
-            "mimeType != 'application/vnd.google-apps.form'",
-            "mimeType != 'application/vnd.google-apps.map'",
-        ]
+        queries = ["'{}' in parents".format(folder_id)] + self.BASE_QUERY_CLAUSES
         if title:
             queries.append("title = '{}'".format(clean_query(title)))
         return ' and '.join(queries)
@@ -364,7 +414,7 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, 403, ),
             throws=exceptions.RevisionsError,
         )
-        data = await resp.json()
+        data = await resp.json(loads=ujson.loads)
         has_revisions = resp.status == 200
 
         if has_revisions and data['items']:
@@ -374,7 +424,9 @@ class GoogleDriveProvider(provider.BaseProvider):
             ]
 
         # Use dummy ID if no revisions found
-        metadata = await self.metadata(path, raw=True)
+        metadata = self._file_metadata_cache.get(path.identifier)
+        if metadata is None:
+            metadata = await self.metadata(path, raw=True)
         revision = {
             'modifiedDate': metadata['modifiedDate'],  # type: ignore
             'id': metadata['etag'] + pd_settings.DRIVE_IGNORE_VERSION,  # type: ignore
@@ -407,7 +459,8 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, ),
             throws=exceptions.CreateFolderError,
         )
-        return GoogleDriveFolderMetadata(await resp.json(), path)
+        self._segment_cache.clear()
+        return GoogleDriveFolderMetadata(await resp.json(loads=ujson.loads), path)
 
     def path_from_metadata(self, parent_path, metadata):
         """ Unfortunately-named method, currently only used to get path name for zip archives. """
@@ -453,19 +506,19 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, ),
             throws=exceptions.UploadError,
         )
-        location = furl.furl(resp.headers['LOCATION'])
-        return location.args['upload_id']
+        # The Location header is the upload-session URL; the file body is PUT to it as-is.
+        return resp.headers['LOCATION']
 
-    async def _finish_resumable_upload(self, segments: Sequence[str], stream, upload_id):
+    async def _finish_resumable_upload(self, stream, location: str):
         resp = await self.make_request(
             'PUT',
-            self._build_upload_url('files', *segments, uploadType='resumable', upload_id=upload_id),
+            location,
             headers={'Content-Length': str(stream.size)},
             data=stream,
             expects=(200, ),
             throws=exceptions.UploadError,
         )
-        return await resp.json()
+        return await resp.json(loads=ujson.loads)
 
     async def _resolve_path_to_ids(self, path, start_at=None):
         """Takes a path and traverses the file tree (ha!) beginning at ``start_at``, looking for
@@ -482,41 +535,51 @@ class GoogleDriveProvider(provider.BaseProvider):
         # parts is list of [path_part_name, is_folder]
         parts = [[parse.unquote(x), True] for x in path.strip('/').split('/')]
 
+        # Bind the per-iteration lookups to locals; this loop is the hottest path in the provider.
+        build_url = self.build_url
+        make_request = self.make_request
+        segment_cache = self._segment_cache
+
         if not path.endswith('/'):
             parts[-1][1] = False
         while parts:
             current_part = parts.pop(0)
             part_name, part_is_folder = current_part[0], current_part[1]
-            name, ext = os.path.splitext(part_name)
-            if not part_is_folder and ext in ('.gdoc', '.gdraw', '.gslides', '.gsheet'):
+
+            cached = segment_cache.get((item_id, part_name, part_is_folder))
+            if cached is not None:
+                ret.append(cached)
+                item_id = cached['id']
+                continue
+            parent_id = item_id
+
+            # Only files can carry a gdoc extension; skip the splitext for folder segments.
+            if part_is_folder:
+                name, ext = part_name, ''
+            else:
+                name, ext = os.path.splitext(part_name)
+            if ext in utils.DOCS_EXTENSIONS:
                 gd_ext = utils.get_mimetype_from_ext(ext)
                 query = "title = '{}' " \
                         "and trashed = false " \
-                        "and mimeType = '{}'".format(clean_query(name), gd_ext)
+                        "and mimeType = '{}' " \
+                        "and '{}' in parents".format(clean_query(name), gd_ext, parent_id)
             else:
-                query = "title = '{}' " \
-                        "and trashed = false " \
-                        "and mimeType != 'application/vnd.google-apps.form' " \
-                        "and mimeType != 'application/vnd.google-apps.map' " \
-                        "and mimeType != 'application/vnd.google-apps.document' " \
-                        "and mimeType != 'application/vnd.google-apps.drawing' " \
-                        "and mimeType != 'application/vnd.google-apps.presentation' " \
-                        "and mimeType != 'application/vnd.google-apps.spreadsheet' " \
-                        "and mimeType {} '{}'".format(
-                            clean_query(part_name),
-                            '=' if part_is_folder else '!=',
-                            self.FOLDER_MIME_TYPE
-                        )
-            resp = await self.make_request(
+                query = SEGMENT_QUERY_TEMPLATE.format_map({
+                    'name': clean_query(part_name),
+                    'op': '=' if part_is_folder else '!=',
+                    'parent': parent_id,
+                })
+            resp = await make_request(
                 'GET',
-                self.build_url('files', item_id, 'children', q=query, fields='items(id)'),
+                build_url('files', q=query, fields='items(id,title,mimeType)'),
                 expects=(200, ),
                 throws=exceptions.MetadataError,
             )
-            data = await resp.json()
+            data = await resp.json(loads=ujson.loads)
 
             try:
-                item_id = data['items'][0]['id']
+                item = data['items'][0]
             except (KeyError, IndexError):
                 if parts:
                     # if we can't find an intermediate path part, that's an error
@@ -528,13 +591,9 @@ class GoogleDriveProvider(provider.BaseProvider):
                     'mimeType': 'folder' if part_is_folder else '',
                 }]
 
-            resp = await self.make_request(
-                'GET',
-                self.build_url('files', item_id, fields='id,title,mimeType'),
-                expects=(200, ),
-                throws=exceptions.MetadataError,
-            )
-            ret.append(await resp.json())
+            item_id = item['id']
+            segment_cache[(parent_id, part_name, part_is_folder)] = item
+            ret.append(item)
         return ret
 
     async def _handle_docs_versioning(self, path: GoogleDrivePath, item: dict, raw: bool=True):
@@ -563,7 +622,7 @@ class GoogleDriveProvider(provider.BaseProvider):
             expects=(200, ),
             throws=exceptions.RevisionsError,
         )
-        revisions_data = await resp.json()
+        revisions_data = await resp.json(loads=ujson.loads)
         has_revisions = revisions_data['items'] is not None
 
         # Revisions are not available for some sharing configurations. If revisions list is empty,
@@ -582,22 +641,46 @@ class GoogleDriveProvider(provider.BaseProvider):
                                raw: bool=False) -> List[Union[BaseGoogleDriveMetadata, dict]]:
         query = self._build_query(path.identifier)
         built_url = self.build_url('files', q=query, alt='json', maxResults=1000)
-        full_resp = []
-        while built_url:
-            resp = await self.make_request(
-                'GET',
-                built_url,
-                expects=(200, ),
-                throws=exceptions.MetadataError,
-            )
-            resp_json = await resp.json()
+        full_resp = []  # type: list
+        page_task = asyncio.ensure_future(self._folder_list_page(built_url))
+        while page_task is not None:
+            items, next_link = await page_task
+            # Dispatch the next page request before serializing the current one so the network
+            # round-trip overlaps the Python-side work.
+            if next_link:
+                page_task = asyncio.ensure_future(self._folder_list_page(next_link))
+            else:
+                page_task = None
             full_resp.extend([
                 self._serialize_item(path.child(item['title']), item, raw=raw)
-                for item in resp_json['items']
+                for item in items
             ])
-            built_url = resp_json.get('nextLink', None)
         return full_resp
 
+    async def _folder_list_page(self, built_url: str) -> Tuple[list, str]:
+        """Fetch and parse a single folder-listing page, returning its items and the link to the
+        next page (or ``None``).  Pages are remembered by URL with their ETag so repeats can be
+        answered with a 304; see ``_folder_list_cache``.
+        """
+        cached = self._folder_list_cache.get(built_url)
+        resp = await self.make_request(
+            'GET',
+            built_url,
+            headers={'If-None-Match': cached[0]} if cached else {},
+            expects=(200, 304, ),
+            throws=exceptions.MetadataError,
+        )
+        if resp.status == 304:
+            await resp.release()
+            return cached[1], cached[2]
+
+        resp_json = await resp.json(loads=ujson.loads)
+        items, next_link = resp_json['items'], resp_json.get('nextLink', None)
+        etag = resp.headers.get('ETag')
+        if etag:
+            self._folder_list_cache[built_url] = (etag, items, next_link)
+        return items, next_link
+
     async def _file_metadata(self,
                              path: GoogleDrivePath,
                              revision: str=None,
@@ -649,7 +732,7 @@ class GoogleDriveProvider(provider.BaseProvider):
             throws=exceptions.MetadataError,
         )
         try:
-            data = await resp.json()
+            data = await resp.json(loads=ujson.loads)
         except Exception:  # some 404s return a string instead of json
             data = await resp.read()
 
@@ -659,6 +742,8 @@ class GoogleDriveProvider(provider.BaseProvider):
         if revision and valid_revision:
             return GoogleDriveFileRevisionMetadata(data, path)
 
+        self._file_metadata_cache[path.identifier] = data
+
         user_role = data['userPermission']['role']
         self.metrics.add('_file_metadata.user_role', user_role)
         can_access_revisions = user_role in self.ROLES_ALLOWING_REVISIONS
@@ -693,16 +778,20 @@ class GoogleDriveProvider(provider.BaseProvider):
             throws=exceptions.MetadataError)
 
         try:
-            child_ids = (await resp.json())['items']
+            child_ids = (await resp.json(loads=ujson.loads))['items']
         except (KeyError, IndexError):
             raise exceptions.MetadataError('{} not found'.format(str(path)),
                                            code=HTTPStatus.NOT_FOUND)
 
-        for child in child_ids:
-            await self.make_request(
+        # Trash the children concurrently; ``make_request`` is throttled, so
+        # concurrency stays bounded by the provider-wide request limit.
+        await asyncio.gather(*[
+            self.make_request(
                 'PUT',
                 self.build_url('files', child['id']),
-                data=json.dumps({'labels': {'trashed': 'true'}}),
+                data=TRASH_BODY,
                 headers={'Content-Type': 'application/json'},
                 expects=(200, ),
                 throws=exceptions.DeleteError)
+            for child in child_ids
+        ])
@@ -30,6 +30,10 @@ DOCS_DEFAULT_FORMAT = {
     'type': 'application/pdf',
 }
 
+# Lookup tables derived from DOCS_FORMATS, built once at import time.
+DOCS_EXTENSIONS = frozenset(format['ext'] for format in DOCS_FORMATS)
+_EXT_TO_MIME_TYPE = {format['ext']: format['mime_type'] for format in DOCS_FORMATS}
+
 
 def is_docs_file(metadata):
     """Only Docs files have the "exportLinks" key."""
@@ -37,9 +41,7 @@ def is_docs_file(metadata):
 
 
 def get_mimetype_from_ext(ext):
-    for format in DOCS_FORMATS:
-        if format['ext'] == ext:
-            return format['mime_type']
+    return _EXT_TO_MIME_TYPE.get(ext)
 
 
 def get_format(metadata):
@@ -182,5 +182,12 @@ WEBDAV_METHODS = {'PROPFIND', 'MKCOL', 'MOVE', 'COPY'}
 
 AIOHTTP_TIMEOUT = int(config.get('AIOHTTP_TIMEOUT', 3600))  # time in seconds
 
+# Connection-pool tuning for the per-provider aiohttp sessions.  Provider actions commonly issue
+# several small HTTPS requests against the same host; keeping connections alive avoids paying the
+# TCP+TLS handshake on each one.
+AIOHTTP_CONNECTOR_LIMIT = int(config.get('AIOHTTP_CONNECTOR_LIMIT', 100))
+AIOHTTP_CONNECTOR_LIMIT_PER_HOST = int(config.get('AIOHTTP_CONNECTOR_LIMIT_PER_HOST', 32))
+AIOHTTP_KEEPALIVE_TIMEOUT = int(config.get('AIOHTTP_KEEPALIVE_TIMEOUT', 30))  # time in seconds
+
 OSF_URL = config.get('OSF_URL', 'http://192.168.168.167:5000')
 FILENAME_NORMALIZATION_RULE = config.get('FILENAME_NORMALIZATION_RULE', 'NFC')